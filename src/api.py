@@ -1,37 +1,162 @@
 #src/api.py
 import sys
 import os
+import time
+_process_start = time.perf_counter()
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import asyncio
+import logging
+import socket
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, conint
 import pickle
 from src.model_training import predict_glucose, get_diabetic_recommendation
+from src.data_generation import ALL_FOODS
+from src.food_index import build_food_index, suggest_alternatives
+from src.meal_planner import MAX_PLAN_ITEMS, MAX_PORTION_SIZES, MAX_TIME_BUDGET, plan_meals
+from src.feedback_log import append_feedback
+from src.feedback_training import FEEDBACK_DIR, feedback_log_dir, load_feedback_state, retrain_from_feedback
 from src.utils import setup_logging
 
+logger = logging.getLogger("FoodGlucoseApp")
+
+# Artifact paths default to the repository root, so the API can be started from any directory
+ARTIFACT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+MODEL_PATH = os.environ.get("FOOD_GLUCOSE_MODEL_PATH", os.path.join(ARTIFACT_DIR, "food_glucose_model.pkl"))
+VECTORIZER_PATH = os.environ.get("FOOD_VECTORIZER_PATH", os.path.join(ARTIFACT_DIR, "food_vectorizer.pkl"))
+
+def load_artifacts(model_path, vectorizer_path):
+    """
+    Load the trained model and vectorizer.
+    Args:
+        model_path (str): Path to the pickled model.
+        vectorizer_path (str): Path to the pickled TF-IDF vectorizer.
+    Returns:
+        model: Trained model.
+        vectorizer: Fitted TF-IDF vectorizer.
+    """
+    try:
+        with open(model_path, "rb") as f:
+            model = pickle.load(f)
+        with open(vectorizer_path, "rb") as f:
+            vectorizer = pickle.load(f)
+        logger.info(f"Model and vectorizer loaded from {model_path} and {vectorizer_path}.")
+        return model, vectorizer
+    except FileNotFoundError as e:
+        logger.error(f"Model or vectorizer file not found: {e}")
+        raise FileNotFoundError(
+            f"Ensure {model_path} and {vectorizer_path} exist, or set FOOD_GLUCOSE_MODEL_PATH and FOOD_VECTORIZER_PATH."
+        )
+
+def warm_up(model, vectorizer):
+    """
+    Exercise the prediction path once over the whole catalog, plus the default meal plan,
+    so the first real requests do not pay for lazy initialization.
+    Args:
+        model: Trained model.
+        vectorizer: Fitted TF-IDF vectorizer.
+    """
+    names = [food["name"] for food in ALL_FOODS]
+    predictions = model.predict(vectorizer.transform([name.lower() for name in names]))
+    for name, glucose_content in zip(names, predictions):
+        get_diabetic_recommendation(round(float(glucose_content), 2), name)
+    plan_meals()
+
+def start_worker(app):
+    """Load artifacts, build the food index and warm up, then mark the app ready."""
+    try:
+        load_start = time.perf_counter()
+        model, vectorizer = load_artifacts(MODEL_PATH, VECTORIZER_PATH)
+        food_index = build_food_index()
+        warmup_start = time.perf_counter()
+        warm_up(model, vectorizer)
+        ready_at = time.perf_counter()
+
+        app.state.model = model
+        app.state.vectorizer = vectorizer
+        app.state.food_index = food_index
+        app.state.corrections = load_feedback_state(FEEDBACK_DIR)["corrections"]
+        app.state.startup_timings = {
+            "load_s": round(warmup_start - load_start, 3),
+            "warmup_s": round(ready_at - warmup_start, 3),
+            "cold_start_to_ready_s": round(ready_at - _process_start, 3)
+        }
+        app.state.ready = True
+        logger.info(f"API ready: {app.state.startup_timings}")
+    except Exception as e:
+        app.state.startup_error = str(e)
+        logger.error(f"API startup failed: {e}")
+
+@asynccontextmanager
+async def lifespan(app):
+    setup_logging()
+    app.state.ready = False
+    app.state.startup_error = None
+    app.state.startup_timings = {}
+    # Warm up off the event loop so /live answers while the worker is still cold
+    startup = asyncio.create_task(asyncio.to_thread(start_worker, app))
+    yield
+    await startup
+
 # Initialize FastAPI app
-app = FastAPI(title="Food Glucose Predictor API", description="API for predicting glucose content and diabetic recommendations.")
-
-# Set up logging
-logger = setup_logging()
-
-# Load model and vectorizer
-try:
-    with open("../food_glucose_model.pkl", "rb") as f:
-        model = pickle.load(f)
-    with open("../food_vectorizer.pkl", "rb") as f:
-        vectorizer = pickle.load(f)
-    logger.info("Model and vectorizer loaded successfully.")
-except FileNotFoundError as e:
-    logger.error(f"Model or vectorizer file not found: {e}")
-    raise FileNotFoundError("Ensure food_glucose_model.pkl and food_vectorizer.pkl exist.")
+app = FastAPI(title="Food Glucose Predictor API", description="API for predicting glucose content and diabetic recommendations.", lifespan=lifespan)
+
+def require_ready():
+    if not app.state.ready:
+        raise HTTPException(status_code=503, detail=app.state.startup_error or "Model is still loading.")
 
 # Define request body schema
 class FoodInput(BaseModel):
     food_name: str
 
-# Health check endpoint
+class AlternativesInput(BaseModel):
+    food_name: str
+    k: int = 3
+
+class MealPlanInput(BaseModel):
+    max_glycemic_load: float = 80
+    min_calories: float = Field(default=1800, ge=0)
+    min_protein: float = Field(default=60, ge=0)
+    category_minimums: dict[str, int] = {"Injera": 1}
+    portion_sizes: list[conint(gt=0)] = Field(default=[50, 100, 150, 200], min_length=1, max_length=MAX_PORTION_SIZES)
+    max_items: int = Field(default=6, ge=1, le=MAX_PLAN_ITEMS)
+    time_budget: float = Field(default=2.0, gt=0, le=MAX_TIME_BUDGET)
+
+class FeedbackEvent(BaseModel):
+    food_name: str
+    glucose_g_per_100g: float
+    source: str = "measurement"
+
+class FeedbackInput(BaseModel):
+    events: list[FeedbackEvent]
+
+class RetrainInput(BaseModel):
+    refit_all: bool = False
+
+# Liveness probe: the process is up and startup has not failed
+@app.get("/live")
+async def live_check():
+    if app.state.startup_error:
+        return JSONResponse(status_code=503, content={"status": "failed", "detail": app.state.startup_error})
+    return {"status": "alive"}
+
+# Readiness probe: artifacts are loaded and warmed up
+@app.get("/ready")
+async def ready_check():
+    if not app.state.ready:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "failed" if app.state.startup_error else "starting", "detail": app.state.startup_error}
+        )
+    return {"status": "ready", "startup": app.state.startup_timings}
+
+# Health check endpoint, kept for existing clients; reports readiness
 @app.get("/health")
 async def health_check():
+    if not app.state.ready:
+        return JSONResponse(status_code=503, content={"status": "unhealthy", "detail": app.state.startup_error or "Model is still loading."})
     return {"status": "healthy"}
 
 # Prediction endpoint
@@ -44,13 +169,14 @@ async def predict_glucose_content(food_input: FoodInput):
     Returns:
         dict: Glucose content, glycemic load, and diabetic recommendation.
     """
+    require_ready()
     try:
         food_name = food_input.food_name.strip()
         if not food_name:
             raise ValueError("Food name cannot be empty.")
         
         # Predict glucose content
-        glucose_content = predict_glucose(food_name, model, vectorizer)
+        glucose_content = predict_glucose(food_name, app.state.model, app.state.vectorizer, corrections=app.state.corrections)
         
         # Get diabetic recommendation
         recommendation = get_diabetic_recommendation(glucose_content, food_name)
@@ -58,6 +184,11 @@ async def predict_glucose_content(food_input: FoodInput):
         # Extract glycemic load
         glycemic_load = recommendation.get("glycemic_load")
         
+        # Suggest lower-GL alternatives for foods that should be avoided
+        alternatives = []
+        if recommendation["recommendation"] == "Not Recommended":
+            alternatives = suggest_alternatives(food_name, app.state.food_index)
+        
         logger.info(f"Prediction for '{food_name}': {glucose_content:.2f} g/100g, GL: {glycemic_load}, {recommendation}")
         return {
             "food_name": food_name,
@@ -66,18 +197,133 @@ async def predict_glucose_content(food_input: FoodInput):
             "diabetic_recommendation": {
                 "recommendation": recommendation["recommendation"],
                 "details": recommendation["details"]
-            }
+            },
+            "alternatives": alternatives
         }
     
     except Exception as e:
         logger.error(f"Error processing request for '{food_name}': {e}")
         raise HTTPException(status_code=500, detail=f"Error predicting glucose content: {e}")
 
+# Alternatives endpoint
+@app.post("/alternatives")
+async def get_alternatives(alternatives_input: AlternativesInput):
+    """
+    Suggest similar foods with a lower glycemic load.
+    Args:
+        alternatives_input (AlternativesInput): JSON object with food_name and optional k (e.g., {"food_name": "Baguette", "k": 3}).
+    Returns:
+        dict: Food name and up to k lower-GL alternatives ordered by similarity.
+    """
+    require_ready()
+    food_name = alternatives_input.food_name.strip()
+    if not food_name:
+        raise HTTPException(status_code=400, detail="Food name cannot be empty.")
+    if alternatives_input.k < 1:
+        raise HTTPException(status_code=400, detail="k must be at least 1.")
+    if food_name.lower() not in app.state.food_index["lookup"]:
+        raise HTTPException(status_code=404, detail=f"'{food_name}' is not in the food catalog.")
+    
+    try:
+        alternatives = suggest_alternatives(food_name, app.state.food_index, k=alternatives_input.k)
+        logger.info(f"Alternatives for '{food_name}': {[a['food_name'] for a in alternatives]}")
+        return {"food_name": food_name, "alternatives": alternatives}
+    
+    except Exception as e:
+        logger.error(f"Error suggesting alternatives for '{food_name}': {e}")
+        raise HTTPException(status_code=500, detail=f"Error suggesting alternatives: {e}")
+
+# Meal planner endpoint (sync so the CPU-bound search runs in the threadpool)
+@app.post("/meal-plan")
+def get_meal_plan(plan_input: MealPlanInput):
+    """
+    Plan a day's meals that minimize total glycemic load under calorie, protein and category constraints.
+    Args:
+        plan_input (MealPlanInput): JSON object with constraints (e.g., {"min_calories": 1800, "category_minimums": {"Injera": 1}}).
+    Returns:
+        dict: Plan status, chosen foods with portions and totals.
+    """
+    try:
+        plan = plan_meals(
+            max_glycemic_load=plan_input.max_glycemic_load,
+            min_calories=plan_input.min_calories,
+            min_protein=plan_input.min_protein,
+            category_minimums=plan_input.category_minimums,
+            portion_sizes=tuple(plan_input.portion_sizes),
+            max_items=plan_input.max_items,
+            time_budget=plan_input.time_budget
+        )
+        logger.info(f"Meal plan: {plan['status']}, totals {plan['totals']}, cached: {plan['cached']}")
+        return plan
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid meal plan constraints: {e}")
+    except Exception as e:
+        logger.error(f"Error planning meals: {e}")
+        raise HTTPException(status_code=500, detail=f"Error planning meals: {e}")
+
+# Feedback ingestion endpoint
+@app.post("/feedback")
+def ingest_feedback(feedback_input: FeedbackInput):
+    """
+    Append measured glucose values or user corrections to the feedback log.
+    Args:
+        feedback_input (FeedbackInput): JSON object with a list of events (e.g., {"events": [{"food_name": "Injera", "glucose_g_per_100g": 28.5}]}).
+    Returns:
+        dict: Number of accepted events and the last sequence number.
+    """
+    try:
+        last_seq = append_feedback(feedback_log_dir(FEEDBACK_DIR), [event.model_dump() for event in feedback_input.events])
+        return {"accepted": len(feedback_input.events), "last_seq": last_seq}
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid feedback: {e}")
+    except Exception as e:
+        logger.error(f"Error ingesting feedback: {e}")
+        raise HTTPException(status_code=500, detail=f"Error ingesting feedback: {e}")
+
+# Retraining endpoint
+@app.post("/retrain")
+def retrain(retrain_input: RetrainInput):
+    """
+    Fold new feedback into the model's per-food corrections.
+    Args:
+        retrain_input (RetrainInput): JSON object with optional refit_all (e.g., {"refit_all": false}).
+    Returns:
+        dict: Retrain statistics.
+    """
+    require_ready()
+    try:
+        result = retrain_from_feedback(app.state.model, app.state.vectorizer, FEEDBACK_DIR, refit_all=retrain_input.refit_all)
+        app.state.corrections = dict(result.pop("corrections"))
+        return result
+    
+    except Exception as e:
+        logger.error(f"Error retraining from feedback: {e}")
+        raise HTTPException(status_code=500, detail=f"Error retraining from feedback: {e}")
+
+def find_free_port(host, start_port, attempts=10):
+    """
+    Find the first port in a range that can be bound.
+    Args:
+        host (str): Host interface.
+        start_port (int): First port to try.
+        attempts (int): Number of consecutive ports to try.
+    Returns:
+        int: A free port.
+    """
+    for port in range(start_port, start_port + attempts):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind((host, port))
+                return port
+            except OSError:
+                logger.warning(f"Port {port} is in use")
+    raise OSError(f"No free port in range {start_port}-{start_port + attempts - 1}")
+
 if __name__ == "__main__":
     import uvicorn
-    port = 8000
-    try:
-        uvicorn.run(app, host="0.0.0.0", port=port)
-    except OSError as e:
-        logger.error(f"Port {port} is in use, trying port 8001")
-        uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    setup_logging()
+    host = os.environ.get("API_HOST", "0.0.0.0")
+    port = find_free_port(host, int(os.environ.get("API_PORT", 8000)))
+    uvicorn.run(app, host=host, port=port)
\ No newline at end of file
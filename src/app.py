@@ -1,11 +1,14 @@
 import os
 import sys
+import hashlib
 import streamlit as st
-from google.cloud import vision
 import pickle
 from PIL import Image
 from io import BytesIO
 from pathlib import Path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.food_index import build_food_index, suggest_alternatives
+from src.food_detection import get_detector, detect_foods_concurrently, UNDETECTED
 
 # --- Improved Path Handling ---
 def find_file(filename, search_paths):
@@ -44,9 +47,12 @@ def setup_gcp_credentials():
     """)
     return False
 
-if not setup_gcp_credentials():
+# Set FOOD_DETECTOR=stub to run offline without Google Cloud credentials
+if os.environ.get("FOOD_DETECTOR", "vision") == "vision" and not setup_gcp_credentials():
     st.stop()
 
+detector = get_detector()
+
 # --- Model Loading ---
 def load_model_files():
     """Load model files with proper path resolution"""
@@ -91,36 +97,29 @@ except FileNotFoundError as e:
     """)
     st.stop()
 
-# --- Food Detection Function ---
-def detect_food(image_bytes):
-    """Detect food using Google Cloud Vision"""
-    client = vision.ImageAnnotatorClient()
-    image = vision.Image(content=image_bytes)
-    
-    try:
-        # First try web detection (better for prepared dishes)
-        web_response = client.web_detection(image=image)
-        if web_response.web_detection.web_entities:
-            for entity in web_response.web_detection.web_entities:
-                if entity.score > 0.75:
-                    return entity.description.capitalize()
-        
-        # Then try label detection
-        label_response = client.label_detection(image=image)
-        food_labels = [
-            label.description.capitalize()
-            for label in label_response.label_annotations
-            if label.score > 0.85 and any(
-                kw in label.description.lower() 
-                for kw in ['food', 'dish', 'cuisine', 'meal']
-            )
-        ]
-        
-        return food_labels[0] if food_labels else "Unknown Food"
-    
-    except Exception as e:
-        st.error(f"Detection error: {str(e)}")
-        return "Detection Failed"
+# --- Alternatives Index ---
+@st.cache_resource
+def load_food_index():
+    """Build the nearest-neighbor food index once per server process"""
+    return build_food_index()
+
+food_index = load_food_index()
+
+def alternatives_html(food_name, k=3):
+    """Render lower-GL alternatives for a food as an HTML snippet"""
+    alternatives = suggest_alternatives(food_name, food_index, k=k)
+    if not alternatives:
+        return ""
+    items = "".join(
+        f"<li>{alt['food_name']} ({alt['category']}, GL {alt['glycemic_load']})</li>"
+        for alt in alternatives
+    )
+    return f"<p><strong>Try instead:</strong></p><ul>{items}</ul>"
+
+# --- Batch Prediction ---
+def predict_glucose_batch(food_names):
+    """Predict glucose for several foods in one model call"""
+    return model.predict(vectorizer.transform([name.lower() for name in food_names]))
 
 # --- Recommendation System ---
 def get_diabetic_recommendation(glucose, food_name):
@@ -152,6 +151,29 @@ def get_diabetic_recommendation(glucose, food_name):
             "glycemic_load": round(glycemic_load, 1)
         }
 
+def render_image_result(container, food_name, glucose):
+    """Render the nutrition analysis box for a detected food"""
+    recommendation = get_diabetic_recommendation(glucose, food_name)
+    
+    box_class = ("warning-box" if "⚠️" in recommendation['recommendation'] else 
+                "danger-box" if "❌" in recommendation['recommendation'] else "")
+    suggestions = alternatives_html(food_name) if box_class == "danger-box" else ""
+    
+    container.markdown(f"""
+    <div class="result-box {box_class}">
+        <h3>Nutrition Analysis</h3>
+        <p class="big-font">Glucose: <strong>{glucose:.1f}g/100g</strong></p>
+        <p class="big-font">Glycemic Load: <strong>{recommendation['glycemic_load']}</strong></p>
+        <p class="big-font">Verdict: <strong style="color:{{
+            'green' if '✅' in recommendation['recommendation'] 
+            else 'orange' if '⚠️' in recommendation['recommendation'] 
+            else 'red'
+        }}">{recommendation['recommendation']}</strong></p>
+        <p>{recommendation['details']}</p>
+        {suggestions}
+    </div>
+    """, unsafe_allow_html=True)
+
 # --- Main Application ---
 def main():
     st.set_page_config(
@@ -184,10 +206,11 @@ def main():
     with st.expander("📷 Analyze Food Image", expanded=True):
         col1, col2 = st.columns(2)
         with col1:
-            uploaded_file = st.file_uploader(
-                "Upload food photo", 
+            uploaded_files = st.file_uploader(
+                "Upload food photos", 
                 type=["jpg", "jpeg", "png"],
-                help="Upload a clear image of a single food item"
+                accept_multiple_files=True,
+                help="Upload one or more clear images, e.g. every dish on a mesob platter"
             )
         with col2:
             camera_img = st.camera_input(
@@ -195,42 +218,55 @@ def main():
                 help="Position food in center of frame"
             )
         
-        if uploaded_file or camera_img:
-            image_bytes = uploaded_file.read() if uploaded_file else camera_img.getvalue()
-            
-            with st.spinner("🔍 Analyzing food..."):
+        uploads = [(f.name, f.getvalue()) for f in uploaded_files or []]
+        if camera_img:
+            uploads.append(("Camera photo", camera_img.getvalue()))
+        
+        if uploads:
+            # One slot per photo, filled in as its detection completes
+            slots, images = {}, []
+            for caption, image_bytes in uploads:
+                slot = st.container()
                 try:
-                    img = Image.open(BytesIO(image_bytes))
-                    st.image(img, caption="Your food", width=300, use_column_width=True)
-                    
-                    food_name = detect_food(image_bytes)
-                    if food_name not in ["Unknown Food", "Detection Failed"]:
-                        st.success(f"Detected: **{food_name}**")
-                        
-                        glucose = model.predict(vectorizer.transform([food_name.lower()]))[0]
-                        recommendation = get_diabetic_recommendation(glucose, food_name)
-                        
-                        box_class = ("warning-box" if "⚠️" in recommendation['recommendation'] else 
-                                    "danger-box" if "❌" in recommendation['recommendation'] else "")
-                        
-                        st.markdown(f"""
-                        <div class="result-box {box_class}">
-                            <h3>Nutrition Analysis</h3>
-                            <p class="big-font">Glucose: <strong>{glucose:.1f}g/100g</strong></p>
-                            <p class="big-font">Glycemic Load: <strong>{recommendation['glycemic_load']}</strong></p>
-                            <p class="big-font">Verdict: <strong style="color:{{
-                                'green' if '✅' in recommendation['recommendation'] 
-                                else 'orange' if '⚠️' in recommendation['recommendation'] 
-                                else 'red'
-                            }}">{recommendation['recommendation']}</strong></p>
-                            <p>{recommendation['details']}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.warning("Couldn't identify food. Try manual input below.")
-                
+                    slot.image(Image.open(BytesIO(image_bytes)), caption=caption, width=300)
                 except Exception as e:
-                    st.error(f"Error processing image: {str(e)}")
+                    slot.error(f"Error processing image: {str(e)}")
+                    continue
+                slots[len(images)] = slot
+                images.append(image_bytes)
+            
+            # Streamlit reruns the script on every interaction; photos already seen this session
+            # reuse their detection instead of another billed Vision call
+            detections = st.session_state.setdefault("detections", {})
+            digests = [hashlib.sha256(image_bytes).hexdigest() for image_bytes in images]
+            pending = [i for i, digest in enumerate(digests) if digest not in detections]
+            
+            def show_results(results):
+                """Label each photo, then predict and render all detected foods in one batched call"""
+                detected = []
+                for i, food_name in results:
+                    if food_name in UNDETECTED:
+                        slots[i].warning("Couldn't identify food. Try manual input below.")
+                    else:
+                        slots[i].success(f"Detected: **{food_name}**")
+                        detected.append((i, food_name))
+                if detected:
+                    try:
+                        glucose_values = predict_glucose_batch([food_name for _, food_name in detected])
+                        for (i, food_name), glucose in zip(detected, glucose_values):
+                            render_image_result(slots[i], food_name, glucose)
+                    except Exception as e:
+                        st.error(f"Error processing image: {str(e)}")
+            
+            # Cached photos are shown straight away, then each new photo as its detection completes
+            show_results([(i, detections[digest]) for i, digest in enumerate(digests) if digest in detections])
+            if pending:
+                with st.spinner(f"🔍 Analyzing {len(pending)} new photo(s)..."):
+                    for j, food_name in detect_foods_concurrently([images[i] for i in pending], detector):
+                        i = pending[j]
+                        if food_name != "Detection Failed":
+                            detections[digests[i]] = food_name
+                        show_results([(i, food_name)])
 
     # Manual Input Section
     with st.expander("✍️ Manual Input", expanded=False):
@@ -243,6 +279,7 @@ def main():
                     
                     box_class = ("warning-box" if "⚠️" in recommendation['recommendation'] else 
                                 "danger-box" if "❌" in recommendation['recommendation'] else "")
+                    suggestions = alternatives_html(food_text) if box_class == "danger-box" else ""
                     
                     st.markdown(f"""
                     <div class="result-box {box_class}">
@@ -250,6 +287,7 @@ def main():
                         <p class="big-font">Glucose: <strong>{glucose:.1f}g/100g</strong></p>
                         <p class="big-font">Recommendation: <strong>{recommendation['recommendation']}</strong></p>
                         <p>{recommendation['details']}</p>
+                        {suggestions}
                     </div>
                     """, unsafe_allow_html=True)
                 except Exception as e:
@@ -0,0 +1,291 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import math
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from src.utils import setup_logging
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = setup_logging()
+
+# Segments rotate once they pass SEGMENT_BYTES; once COMPACTION_MIN_SEGMENTS closed segments
+# smaller than COMPACTED_SEGMENT_BYTES pile up, compact_segments merges runs of them into larger
+# segments. Compaction is not run on the append path; the retrain job calls it.
+SEGMENT_BYTES = 1 << 20
+COMPACTED_SEGMENT_BYTES = 32 << 20
+COMPACTION_MIN_SEGMENTS = 8
+
+SOURCES = {"measurement": 0, "correction": 1}
+SOURCE_NAMES = {code: name for name, code in SOURCES.items()}
+
+# CRC32 of the rest of the record, then seq, timestamp, glucose_g_per_100g, source, name length;
+# followed by the UTF-8 food name
+_CRC = struct.Struct("<I")
+_RECORD = struct.Struct("<QddBH")
+_SEGMENT_SUFFIX = ".seg"
+_APPEND_LOCK = "append.lock"
+_COMPACT_LOCK = "compact.lock"
+
+_lock = threading.Lock()
+_compact_lock = threading.Lock()
+# log_dir -> (active segment path, its size after our last append, next seq). Only trusted while
+# the active segment is unchanged; any other writer changes its size or starts a new segment.
+_tail = {}
+
+@contextmanager
+def _file_lock(log_dir, name, blocking=True):
+    """
+    Hold an exclusive OS-level lock on a file in log_dir, shared by every process using the log.
+    Yields whether the lock was taken, which is only False for a non-blocking attempt.
+    """
+    with open(os.path.join(log_dir, name), "a+b") as f:
+        try:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            if blocking:
+                raise
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _segments(log_dir):
+    """List segments as (first sequence number, path), oldest first. Segments are named by their first seq."""
+    if not os.path.isdir(log_dir):
+        return []
+    return sorted(
+        (int(name[:-len(_SEGMENT_SUFFIX)]), os.path.join(log_dir, name))
+        for name in os.listdir(log_dir) if name.endswith(_SEGMENT_SUFFIX)
+    )
+
+def _segment_path(log_dir, first_seq):
+    return os.path.join(log_dir, f"{first_seq:012d}{_SEGMENT_SUFFIX}")
+
+def _encode(seq, timestamp, food_name, glucose, source):
+    name = food_name.encode("utf-8")
+    body = _RECORD.pack(seq, timestamp, glucose, SOURCES[source], len(name)) + name
+    return _CRC.pack(zlib.crc32(body)) + body
+
+def _decode(data):
+    """Decode records, stopping at a torn or corrupt record left by an interrupted write. Returns (records, valid bytes)."""
+    records = []
+    offset = 0
+    while offset + _CRC.size + _RECORD.size <= len(data):
+        body_start = offset + _CRC.size
+        seq, timestamp, glucose, source, name_len = _RECORD.unpack_from(data, body_start)
+        end = body_start + _RECORD.size + name_len
+        if end > len(data) or _CRC.unpack_from(data, offset)[0] != zlib.crc32(data[body_start:end]):
+            break
+        records.append({
+            "seq": seq,
+            "timestamp": timestamp,
+            "food_name": data[body_start + _RECORD.size:end].decode("utf-8"),
+            "glucose_g_per_100g": glucose,
+            "source": SOURCE_NAMES.get(source, "unknown")
+        })
+        offset = end
+    return records, offset
+
+def read_segment(path):
+    """
+    Read all complete records from a segment file.
+    Args:
+        path (str): Segment path.
+    Returns:
+        list: Records in sequence order.
+    """
+    with open(path, "rb") as f:
+        return _decode(f.read())[0]
+
+def read_events(log_dir, after_seq=0):
+    """
+    Read events with a sequence number greater than after_seq.
+    Segments that lie entirely before after_seq are skipped without being opened.
+    Args:
+        log_dir (str): Directory holding the segments.
+        after_seq (int): Last sequence number already consumed.
+    Yields:
+        dict: Events in sequence order.
+    """
+    last = after_seq
+    segments = _segments(log_dir)
+    for i, (_, path) in enumerate(segments):
+        if i + 1 < len(segments) and segments[i + 1][0] <= last + 1:
+            continue
+        try:
+            records = read_segment(path)
+        except FileNotFoundError:
+            # Compacted while we were reading; sequence numbers survive compaction, so resume from the last one
+            yield from read_events(log_dir, last)
+            return
+        for record in records:
+            if record["seq"] > last:
+                last = record["seq"]
+                yield record
+
+def _recover(log_dir):
+    """
+    Truncate a torn tail from the active segment so new records are not written after it,
+    and return the last sequence number in the log.
+    """
+    segments = _segments(log_dir)
+    if not segments:
+        return 0
+    first_seq, path = segments[-1]
+    with open(path, "r+b") as f:
+        data = f.read()
+        records, valid_bytes = _decode(data)
+        if valid_bytes < len(data):
+            logger.warning(f"Truncating {len(data) - valid_bytes} bytes of torn records from {path}")
+            f.truncate(valid_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+    return records[-1]["seq"] if records else first_seq - 1
+
+def _compact(log_dir):
+    """
+    Merge runs of small closed segments into segments of up to COMPACTED_SEGMENT_BYTES.
+    Closed segments are never appended to again, so they are merged without blocking appends;
+    the append lock is only held while a merged segment is swapped in.
+    """
+    closed = [
+        (first_seq, path, os.path.getsize(path))
+        for first_seq, path in _segments(log_dir)[:-1]
+    ]
+    small = [segment for segment in closed if segment[2] < COMPACTED_SEGMENT_BYTES]
+    if len(small) < COMPACTION_MIN_SEGMENTS:
+        return 0
+
+    runs, run, run_bytes = [], [], 0
+    for segment in closed:
+        # Only merge neighbours, so segment ranges stay ordered
+        if segment[2] >= COMPACTED_SEGMENT_BYTES or run_bytes + segment[2] > COMPACTED_SEGMENT_BYTES:
+            runs.append(run)
+            run, run_bytes = [], 0
+        if segment[2] < COMPACTED_SEGMENT_BYTES:
+            run.append(segment)
+            run_bytes += segment[2]
+    runs.append(run)
+
+    merged = 0
+    for run in runs:
+        if len(run) < 2:
+            continue
+        target = run[0][1]
+        tmp_path = target + ".tmp"
+        with open(tmp_path, "wb") as out:
+            for _, path, _ in run:
+                with open(path, "rb") as f:
+                    data = f.read()
+                out.write(data[:_decode(data)[1]])
+            out.flush()
+            os.fsync(out.fileno())
+        # Replace the first segment, then drop the rest; readers skip duplicate seqs if we stop halfway
+        with _lock, _file_lock(log_dir, _APPEND_LOCK):
+            os.replace(tmp_path, target)
+            for _, path, _ in run[1:]:
+                os.remove(path)
+        merged += len(run)
+    if merged:
+        logger.info(f"Compacted {merged} feedback segments in {log_dir}")
+    return merged
+
+def compact_segments(log_dir):
+    """
+    Merge small closed segments. Returns straight away if another process is compacting the log.
+    Args:
+        log_dir (str): Directory holding the segments.
+    Returns:
+        int: Number of segments merged.
+    """
+    try:
+        log_dir = os.path.abspath(log_dir)
+        if not os.path.isdir(log_dir):
+            return 0
+        with _compact_lock, _file_lock(log_dir, _COMPACT_LOCK, blocking=False) as locked:
+            return _compact(log_dir) if locked else 0
+
+    except Exception as e:
+        logger.error(f"Error compacting feedback segments: {e}")
+        raise
+
+def append_feedback(log_dir, events):
+    """
+    Append feedback events to the log. Safe to call from several threads and processes: appends
+    hold a lock file in log_dir and take the next sequence number from disk when another writer
+    has touched the log since this process last appended.
+    Args:
+        log_dir (str): Directory holding the segments.
+        events (list): Dicts with food_name, glucose_g_per_100g and optional source
+            ("measurement" or "correction", default "measurement").
+    Returns:
+        int: Sequence number of the last appended event.
+    """
+    try:
+        if not events:
+            raise ValueError("No feedback events to append.")
+        cleaned = []
+        for event in events:
+            food_name = str(event.get("food_name", "")).strip().lower()
+            glucose = float(event.get("glucose_g_per_100g", float("nan")))
+            source = event.get("source", "measurement")
+            if not food_name:
+                raise ValueError("Food name cannot be empty.")
+            if len(food_name.encode("utf-8")) > 0xFFFF:
+                raise ValueError("Food name is too long.")
+            if not math.isfinite(glucose) or glucose < 0:
+                raise ValueError(f"Invalid glucose value for '{food_name}': {glucose}")
+            if source not in SOURCES:
+                raise ValueError(f"Unknown feedback source '{source}', expected one of {sorted(SOURCES)}.")
+            cleaned.append((food_name, glucose, source))
+
+        log_dir = os.path.abspath(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
+        with _lock, _file_lock(log_dir, _APPEND_LOCK):
+            segments = _segments(log_dir)
+            active = (segments[-1][1], os.path.getsize(segments[-1][1])) if segments else None
+            tail = _tail.get(log_dir)
+            if tail and tail[:2] == active:
+                first_seq = tail[2]
+            else:
+                first_seq = _recover(log_dir) + 1
+                active = (segments[-1][1], os.path.getsize(segments[-1][1])) if segments else None
+
+            if active and active[1] < SEGMENT_BYTES:
+                path = active[0]
+            else:
+                path = _segment_path(log_dir, first_seq)
+
+            now = time.time()
+            payload = b"".join(
+                _encode(first_seq + i, now, food_name, glucose, source)
+                for i, (food_name, glucose, source) in enumerate(cleaned)
+            )
+            with open(path, "ab") as f:
+                f.write(payload)
+                size = f.tell()
+            _tail[log_dir] = (path, size, first_seq + len(cleaned))
+            return first_seq + len(cleaned) - 1
+
+    except Exception as e:
+        logger.error(f"Error appending feedback: {e}")
+        raise
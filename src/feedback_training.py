@@ -0,0 +1,159 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pickle
+import threading
+import time
+from src.feedback_log import append_feedback, compact_segments, read_events
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+FEEDBACK_DIR = os.environ.get(
+    "FEEDBACK_DIR", os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'feedback'))
+)
+# Number of feedback events at which a food's correction is weighted equally with the base model
+PRIOR_STRENGTH = 5
+
+_retrain_lock = threading.Lock()
+
+def feedback_log_dir(feedback_dir=FEEDBACK_DIR):
+    return os.path.join(feedback_dir, "segments")
+
+def _state_path(feedback_dir):
+    return os.path.join(feedback_dir, "aggregates.pkl")
+
+def load_feedback_state(feedback_dir=FEEDBACK_DIR):
+    """
+    Load the cached feedback aggregates and per-food corrections.
+    Args:
+        feedback_dir (str): Feedback directory.
+    Returns:
+        dict: last_seq consumed, aggregates {food: [count, glucose sum]} and corrections {food: g/100g}.
+    """
+    try:
+        with open(_state_path(feedback_dir), "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return {"last_seq": 0, "aggregates": {}, "corrections": {}}
+
+def _save_feedback_state(feedback_dir, state):
+    os.makedirs(feedback_dir, exist_ok=True)
+    tmp_path = _state_path(feedback_dir) + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(state, f)
+    os.replace(tmp_path, _state_path(feedback_dir))
+
+def retrain_from_feedback(model, vectorizer, feedback_dir=FEEDBACK_DIR, refit_all=False, prior_strength=PRIOR_STRENGTH):
+    """
+    Fold new feedback into the cached aggregates and refit the corrections of foods that changed,
+    then compact the log. Only log segments past the last consumed sequence number are read. The base model is kept as
+    is; each food with feedback gets a correction towards its measured mean, shrunk by
+    count / (count + prior_strength) so a single reading cannot override the model.
+    Args:
+        model: Trained model.
+        vectorizer: Fitted TF-IDF vectorizer.
+        feedback_dir (str): Feedback directory.
+        refit_all (bool): Refit every correction, e.g. after the base model was retrained.
+        prior_strength (float): Shrinkage towards the base model prediction.
+    Returns:
+        dict: Corrections and retrain statistics.
+    """
+    try:
+        with _retrain_lock:
+            start = time.perf_counter()
+            state = load_feedback_state(feedback_dir)
+            aggregates = state["aggregates"]
+            corrections = state["corrections"]
+            last_seq = state["last_seq"]
+
+            changed = set()
+            new_events = 0
+            for event in read_events(feedback_log_dir(feedback_dir), after_seq=last_seq):
+                stats = aggregates.setdefault(event["food_name"], [0, 0.0])
+                stats[0] += 1
+                stats[1] += event["glucose_g_per_100g"]
+                changed.add(event["food_name"])
+                last_seq = event["seq"]
+                new_events += 1
+            read_done = time.perf_counter()
+
+            to_refit = sorted(aggregates if refit_all else changed)
+            if to_refit:
+                base_predictions = model.predict(vectorizer.transform(to_refit))
+                for food_name, base_prediction in zip(to_refit, base_predictions):
+                    count, total = aggregates[food_name]
+                    weight = count / (count + prior_strength)
+                    corrections[food_name] = round(weight * (total / count - float(base_prediction)), 4)
+            refit_done = time.perf_counter()
+
+            state["last_seq"] = last_seq
+            _save_feedback_state(feedback_dir, state)
+            saved = time.perf_counter()
+
+            # Compaction is kept off the ingest path; retraining is the periodic job that owns it
+            compacted = compact_segments(feedback_log_dir(feedback_dir))
+
+            result = {
+                "new_events": new_events,
+                "refit_foods": len(to_refit),
+                "last_seq": last_seq,
+                "read_ms": round((read_done - start) * 1000, 2),
+                "refit_ms": round((refit_done - read_done) * 1000, 2),
+                "compacted_segments": compacted,
+                "compact_ms": round((time.perf_counter() - saved) * 1000, 2),
+                "total_ms": round((time.perf_counter() - start) * 1000, 2),
+                "corrections": corrections
+            }
+            logger.info(
+                f"Retrained from feedback: {new_events} new events, {len(to_refit)} foods refit in {result['total_ms']} ms"
+            )
+            return result
+
+    except Exception as e:
+        logger.error(f"Error retraining from feedback: {e}")
+        raise
+
+if __name__ == "__main__":
+    import random
+    import shutil
+    import tempfile
+    from src.data_generation import ALL_FOODS, generate_food_dataset
+    from src.model_training import train_model
+
+    def random_events(n):
+        return [
+            {"food_name": food["name"], "glucose_g_per_100g": random.uniform(*food["carb_range"]) * 0.5}
+            for food in random.choices(ALL_FOODS, k=n)
+        ]
+
+    model, vectorizer = train_model(generate_food_dataset(1000))
+    feedback_dir = tempfile.mkdtemp()
+    log_dir = feedback_log_dir(feedback_dir)
+    batch_size = 1000
+    try:
+        log_size = 0
+        for target_size in [10000, 100000, 1000000]:
+            # Ingest throughput while growing the log
+            n_batches = (target_size - log_size) // batch_size
+            start = time.perf_counter()
+            for _ in range(n_batches):
+                append_feedback(log_dir, random_events(batch_size))
+            ingest_s = time.perf_counter() - start
+            log_size += n_batches * batch_size
+            logger.info(f"Benchmark: log size {log_size}, ingest {n_batches * batch_size / ingest_s:,.0f} events/sec")
+
+            # Retrain from scratch over the whole log, then incrementally after one more batch
+            if os.path.exists(_state_path(feedback_dir)):
+                os.remove(_state_path(feedback_dir))
+            full = retrain_from_feedback(model, vectorizer, feedback_dir)
+            append_feedback(log_dir, random_events(batch_size))
+            log_size += batch_size
+            incremental = retrain_from_feedback(model, vectorizer, feedback_dir)
+            logger.info(
+                f"Benchmark: log size {log_size}, full retrain {full['total_ms']} ms, "
+                f"incremental retrain of {incremental['new_events']} events {incremental['total_ms']} ms, "
+                f"compacted {full['compacted_segments']} segments in {full['compact_ms']} ms"
+            )
+    finally:
+        shutil.rmtree(feedback_dir)
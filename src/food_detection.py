@@ -0,0 +1,120 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+MAX_CONCURRENT_DETECTIONS = int(os.environ.get("FOOD_DETECTION_CONCURRENCY", 4))
+UNDETECTED = ("Unknown Food", "Detection Failed")
+
+@lru_cache(maxsize=1)
+def _vision_client():
+    from google.cloud import vision
+    return vision.ImageAnnotatorClient()
+
+def detect_food_vision(image_bytes):
+    """
+    Detect food using Google Cloud Vision.
+    Args:
+        image_bytes (bytes): Encoded image.
+    Returns:
+        str: Detected food name, or one of UNDETECTED.
+    """
+    from google.cloud import vision
+    client = _vision_client()
+    image = vision.Image(content=image_bytes)
+
+    try:
+        # First try web detection (better for prepared dishes)
+        web_response = client.web_detection(image=image)
+        if web_response.web_detection.web_entities:
+            for entity in web_response.web_detection.web_entities:
+                if entity.score > 0.75:
+                    return entity.description.capitalize()
+
+        # Then try label detection
+        label_response = client.label_detection(image=image)
+        food_labels = [
+            label.description.capitalize()
+            for label in label_response.label_annotations
+            if label.score > 0.85 and any(
+                kw in label.description.lower()
+                for kw in ['food', 'dish', 'cuisine', 'meal']
+            )
+        ]
+
+        return food_labels[0] if food_labels else "Unknown Food"
+
+    except Exception as e:
+        logger.error(f"Detection error: {e}")
+        return "Detection Failed"
+
+def make_stub_detector(names=("Injera", "Tibs", "Shiro", "Pasta", "Baguette"), delay=0.5):
+    """
+    Build an offline detector for development and testing.
+    Args:
+        names (tuple): Food names to return.
+        delay (float): Seconds to sleep per call, standing in for the network round trip.
+    Returns:
+        callable: Detector that maps image bytes to a name from names, deterministically per image.
+    """
+    def detect(image_bytes):
+        time.sleep(delay)
+        return names[len(image_bytes) % len(names)]
+    return detect
+
+def get_detector(name=None):
+    """
+    Select the food detector.
+    Args:
+        name (str): "vision" or "stub"; defaults to the FOOD_DETECTOR environment variable, then "vision".
+    Returns:
+        callable: Detector taking image bytes and returning a food name.
+    """
+    name = name or os.environ.get("FOOD_DETECTOR", "vision")
+    if name == "vision":
+        return detect_food_vision
+    if name == "stub":
+        return make_stub_detector()
+    raise ValueError(f"Unknown food detector '{name}', expected 'vision' or 'stub'.")
+
+def detect_foods_concurrently(images, detector, max_workers=MAX_CONCURRENT_DETECTIONS):
+    """
+    Run detection over several images on a bounded thread pool.
+    Args:
+        images (list): Encoded images.
+        detector (callable): Detector taking image bytes and returning a food name.
+        max_workers (int): Maximum number of detections in flight.
+    Yields:
+        tuple: (image index, detected food name) in completion order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(detector, image): i for i, image in enumerate(images)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                food_name = future.result()
+            except Exception as e:
+                logger.error(f"Detection failed for image {i}: {e}")
+                food_name = "Detection Failed"
+            yield i, food_name
+
+if __name__ == "__main__":
+    # Compare serial and concurrent detection with the offline stub
+    detector = make_stub_detector(delay=0.2)
+    images = [bytes(n) for n in range(12)]
+
+    start = time.perf_counter()
+    serial = [detector(image) for image in images]
+    serial_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    concurrent = dict(detect_foods_concurrently(images, detector))
+    concurrent_s = time.perf_counter() - start
+
+    assert [concurrent[i] for i in range(len(images))] == serial
+    logger.info(f"{len(images)} images: serial {serial_s:.2f} s, concurrent ({MAX_CONCURRENT_DETECTIONS} workers) {concurrent_s:.2f} s")
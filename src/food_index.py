@@ -0,0 +1,158 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+import numpy as np
+from sklearn.neighbors import BallTree
+from src.data_generation import ALL_FOODS, generate_synthetic_catalog
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+MACRO_RANGES = ["carb_range", "protein_range", "fat_range", "calorie_range"]
+
+def _midpoint(value_range):
+    return sum(value_range) / 2
+
+def build_food_index(foods=ALL_FOODS, category_weight=1.5, leaf_size=16):
+    """
+    Build a ball tree over normalized macro vectors of the food catalog.
+    Each food is represented by the midpoints of its carb, protein, fat and calorie ranges
+    (z-score normalized) plus a one-hot category block scaled by category_weight, so foods
+    of the same category rank ahead of foods with a similar macro profile only.
+    Args:
+        foods (list): Catalog entries as defined in data_generation.
+        category_weight (float): Distance contributed by a category mismatch.
+        leaf_size (int): Ball tree leaf size.
+    Returns:
+        dict: Index with the tree, feature matrix and per-food metadata.
+    """
+    try:
+        if not foods:
+            raise ValueError("Food catalog is empty.")
+
+        macros = np.array([[_midpoint(food[key]) for key in MACRO_RANGES] for food in foods], dtype=float)
+        std = macros.std(axis=0)
+        std[std == 0] = 1.0
+        macros = (macros - macros.mean(axis=0)) / std
+
+        categories = sorted({food["category"] for food in foods})
+        category_pos = {category: i for i, category in enumerate(categories)}
+        one_hot = np.zeros((len(foods), len(categories)))
+        for i, food in enumerate(foods):
+            one_hot[i, category_pos[food["category"]]] = category_weight / np.sqrt(2)
+
+        features = np.hstack([macros, one_hot])
+        glycemic_load = np.array(
+            [round(_midpoint(food["carb_range"]) * _midpoint(food["gi_range"]) / 100, 2) for food in foods]
+        )
+
+        start = time.perf_counter()
+        tree = BallTree(features, leaf_size=leaf_size)
+        logger.info(f"Built food index over {len(foods)} foods in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        return {
+            "tree": tree,
+            "features": features,
+            "names": [food["name"] for food in foods],
+            "categories": [food["category"] for food in foods],
+            "glycemic_load": glycemic_load,
+            "lookup": {food["name"].lower(): i for i, food in enumerate(foods)}
+        }
+
+    except Exception as e:
+        logger.error(f"Error building food index: {e}")
+        raise
+
+def suggest_alternatives(food_name, index, k=3):
+    """
+    Suggest the k most similar catalog foods with a lower glycemic load.
+    Args:
+        food_name (str): Name of the food to replace.
+        index (dict): Index returned by build_food_index.
+        k (int): Number of alternatives to return.
+    Returns:
+        list: Alternatives ordered by similarity, empty if the food is not in the catalog.
+    """
+    try:
+        if not isinstance(food_name, str) or not food_name.strip():
+            raise ValueError("Food name must be a non-empty string.")
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+
+        pos = index["lookup"].get(food_name.strip().lower())
+        if pos is None:
+            logger.warning(f"'{food_name}' is not in the food catalog, no alternatives available.")
+            return []
+
+        glycemic_load = index["glycemic_load"]
+        n_foods = len(index["names"])
+        query = index["features"][pos].reshape(1, -1)
+
+        # Widen the search until enough lower-GL neighbours are found
+        query_k = min(n_foods, 4 * k + 1)
+        while True:
+            distances, indices = index["tree"].query(query, k=query_k)
+            hits = [
+                (distance, i) for distance, i in zip(distances[0], indices[0])
+                if i != pos and glycemic_load[i] < glycemic_load[pos]
+            ]
+            if len(hits) >= k or query_k == n_foods:
+                break
+            query_k = min(n_foods, query_k * 2)
+
+        return [
+            {
+                "food_name": index["names"][i],
+                "category": index["categories"][i],
+                "glycemic_load": float(glycemic_load[i]),
+                "distance": round(float(distance), 3)
+            }
+            for distance, i in hits[:k]
+        ]
+
+    except Exception as e:
+        logger.error(f"Error suggesting alternatives for '{food_name}': {e}")
+        raise
+
+def _brute_force_neighbors(features, query, k):
+    distances = np.sqrt(((features - query) ** 2).sum(axis=1))
+    nearest = np.argpartition(distances, k - 1)[:k]
+    return nearest[np.argsort(distances[nearest])]
+
+def benchmark_food_index(index, n_queries=1000, k=5, seed=42):
+    """
+    Compare ball tree query latency against a brute-force scan over the same feature matrix.
+    Args:
+        index (dict): Index returned by build_food_index.
+        n_queries (int): Number of catalog foods to query.
+        k (int): Neighbours per query.
+        seed (int): Random seed for query selection.
+    Returns:
+        dict: Mean per-query latency in microseconds for both methods.
+    """
+    features = index["features"]
+    k = min(k, len(features))
+    rng = np.random.default_rng(seed)
+    queries = features[rng.integers(0, len(features), size=n_queries)]
+
+    start = time.perf_counter()
+    for query in queries:
+        index["tree"].query(query.reshape(1, -1), k=k)
+    ball_tree_us = (time.perf_counter() - start) / n_queries * 1e6
+
+    start = time.perf_counter()
+    for query in queries:
+        _brute_force_neighbors(features, query, k)
+    brute_us = (time.perf_counter() - start) / n_queries * 1e6
+
+    return {"n_foods": len(features), "ball_tree_us": round(ball_tree_us, 2), "brute_force_us": round(brute_us, 2)}
+
+if __name__ == "__main__":
+    index = build_food_index()
+    for food in ["Mashed Potatoes", "Baguette"]:
+        logger.info(f"Alternatives for {food}: {suggest_alternatives(food, index)}")
+
+    logger.info(f"Benchmark: {benchmark_food_index(index)}")
+    for size in [10000, 100000]:
+        logger.info(f"Benchmark: {benchmark_food_index(build_food_index(generate_synthetic_catalog(size)))}")
@@ -0,0 +1,313 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+import numpy as np
+from src.data_generation import ALL_FOODS, generate_synthetic_catalog
+from src.utils import setup_logging
+
+logger = setup_logging()
+
+_plan_cache = OrderedDict()
+_plan_cache_lock = threading.Lock()
+PLAN_CACHE_SIZE = 128
+MAX_STATES = 2_000_000
+MAX_PLAN_ITEMS = 20
+MAX_PORTION_SIZES = 20
+MAX_TIME_BUDGET = 30.0
+
+def _midpoint(value_range):
+    return sum(value_range) / 2
+
+def _matches(food, key):
+    """A constraint key matches a food whose category equals it or whose name contains it."""
+    return food["category"] == key or key.lower() in food["name"].lower()
+
+def _pareto_layers(points, n_layers):
+    """
+    Return indices of points in the first n_layers Pareto layers, where a point
+    (glycemic_load, calories, protein) dominates another with lower or equal GL and
+    higher or equal calories and protein.
+    """
+    remaining = sorted(range(len(points)), key=lambda i: (points[i][0], -points[i][1], -points[i][2]))
+    kept = []
+    for _ in range(n_layers):
+        if not remaining:
+            break
+        # Staircase of non-dominated (calories, protein) pairs: calories ascending, protein descending
+        cals, prots = [], []
+        dominated = []
+        for i in remaining:
+            _, cal, prot = points[i]
+            pos = bisect_left(cals, cal)
+            if pos < len(cals) and prots[pos] >= prot:
+                dominated.append(i)
+                continue
+            kept.append(i)
+            start = pos
+            while start > 0 and prots[start - 1] <= prot:
+                start -= 1
+            end = pos + 1 if pos < len(cals) and cals[pos] == cal else pos
+            cals[start:end] = [cal]
+            prots[start:end] = [prot]
+        remaining = dominated
+    return kept
+
+def _shift(values, parents, shift, axis, capped=True):
+    """
+    Shift a DP table along one axis, carrying parent indices with it.
+    Capped axes saturate: every state pushed past the last bucket lands in it, keeping the minimum.
+    """
+    if shift == 0:
+        return values, parents
+    size = values.shape[axis]
+    out_values = np.full_like(values, np.inf)
+    out_parents = np.full_like(parents, -1)
+    if shift < size:
+        src = [slice(None)] * values.ndim
+        dst = [slice(None)] * values.ndim
+        src[axis] = slice(0, size - shift)
+        dst[axis] = slice(shift, size)
+        out_values[tuple(dst)] = values[tuple(src)]
+        out_parents[tuple(dst)] = parents[tuple(src)]
+    if capped:
+        tail = [slice(None)] * values.ndim
+        tail[axis] = slice(max(size - 1 - shift, 0), size)
+        tail_values = values[tuple(tail)]
+        best = np.expand_dims(tail_values.argmin(axis=axis), axis)
+        last = [slice(None)] * values.ndim
+        last[axis] = slice(size - 1, size)
+        out_values[tuple(last)] = np.take_along_axis(tail_values, best, axis)
+        out_parents[tuple(last)] = np.take_along_axis(parents[tuple(tail)], best, axis)
+    return out_values, out_parents
+
+def _buckets(value, step, round_up):
+    # Round away float noise first so e.g. 450.0000001 / 25 does not land in the next bucket
+    buckets = round(value / step, 9)
+    return int(np.ceil(buckets)) if round_up else int(np.floor(buckets))
+
+def _solve(foods, constraint_keys, category_minimums, min_calories, min_protein, portion_sizes,
+           max_items, calorie_step, protein_step, deadline, round_up=False):
+    """
+    Multiple-choice covering knapsack: pick at most one portion per food and at most max_items
+    foods, minimizing total glycemic load. State axes are (item count, one per category
+    constraint, calories, protein); calories, protein and category counts saturate at their
+    minimums, so the final state is the top corner of those axes.
+    Calories and protein are counted in buckets of calorie_step / protein_step. Rounding each
+    contribution down only accepts plans that truly meet the minimums; rounding up solves a
+    relaxation whose optimum is a lower bound on the true minimum glycemic load.
+    Returns:
+        tuple: (list of (food index, portion) choices or None, total glycemic load or None,
+            whether the search completed).
+    """
+    shape = (
+        (max_items + 1,)
+        + tuple(category_minimums[key] + 1 for key in constraint_keys)
+        + (int(np.ceil(min_calories / calorie_step)) + 1, int(np.ceil(min_protein / protein_step)) + 1)
+    )
+    if np.prod(shape) > MAX_STATES:
+        raise ValueError(f"Search space of {int(np.prod(shape))} states is too large; relax the constraints or coarsen the steps.")
+    cal_axis, prot_axis = len(shape) - 2, len(shape) - 1
+    table = np.full(shape, np.inf)
+    table[(0,) * len(shape)] = 0.0
+    state_ids = np.arange(table.size).reshape(shape)
+    history = []
+    completed = True
+
+    for food in foods:
+        if time.perf_counter() > deadline:
+            completed = False
+            break
+        gl = _midpoint(food["carb_range"]) * _midpoint(food["gi_range"]) / 100
+        calories = _midpoint(food["calorie_range"])
+        protein = _midpoint(food["protein_range"])
+        matched = [axis + 1 for axis, key in enumerate(constraint_keys) if _matches(food, key)]
+
+        new_table = table.copy()
+        parents = np.full(shape, -1, dtype=np.int32)
+        portions = np.full(shape, -1, dtype=np.int8)
+        for p, portion in enumerate(portion_sizes):
+            scale = portion / 100
+            candidate, candidate_parents = _shift(table, state_ids, 1, 0, capped=False)
+            for axis in matched:
+                candidate, candidate_parents = _shift(candidate, candidate_parents, 1, axis)
+            candidate, candidate_parents = _shift(candidate, candidate_parents, _buckets(calories * scale, calorie_step, round_up), cal_axis)
+            candidate, candidate_parents = _shift(candidate, candidate_parents, _buckets(protein * scale, protein_step, round_up), prot_axis)
+            candidate = candidate + gl * scale
+            better = candidate < new_table
+            new_table[better] = candidate[better]
+            parents[better] = candidate_parents[better]
+            portions[better] = p
+        table = new_table
+        # Keep only the states this food improved; later foods improve fewer and fewer states
+        improved = np.flatnonzero(portions.ravel() >= 0)
+        history.append((improved, parents.ravel()[improved], portions.ravel()[improved]))
+
+    goal = table[(slice(None),) + tuple(size - 1 for size in shape[1:])]
+    if not np.isfinite(goal).any():
+        return None, None, completed
+
+    # Walk the parent pointers back from the cheapest goal state
+    state = int(state_ids[(int(goal.argmin()),) + tuple(size - 1 for size in shape[1:])])
+    choices = []
+    for i in range(len(history) - 1, -1, -1):
+        improved, parents, portions = history[i]
+        pos = int(np.searchsorted(improved, state))
+        if pos < len(improved) and improved[pos] == state:
+            choices.append((i, portion_sizes[int(portions[pos])]))
+            state = int(parents[pos])
+    return choices[::-1], float(goal.min()), completed
+
+def plan_meals(foods=ALL_FOODS, max_glycemic_load=80, min_calories=1800, min_protein=60,
+               category_minimums=None, portion_sizes=(50, 100, 150, 200), max_items=6,
+               time_budget=2.0, calorie_step=25, protein_step=2):
+    """
+    Plan a day's meals from the catalog that minimize total glycemic load.
+    Args:
+        foods (list): Catalog entries as defined in data_generation.
+        max_glycemic_load (float): Upper bound on the plan's total glycemic load.
+        min_calories (float): Minimum total calories (kcal).
+        min_protein (float): Minimum total protein (g).
+        category_minimums (dict): Minimum number of foods per category, e.g. {"Bread": 1}. Keys
+            are also matched against food names, so the default {"Injera": 1} asks for an
+            injera-based food.
+        portion_sizes (tuple): Allowed portion sizes in grams (positive, at most MAX_PORTION_SIZES);
+            each food is used at most once.
+        max_items (int): Maximum number of foods in the plan, at most MAX_PLAN_ITEMS.
+        time_budget (float): Seconds to search before returning the best plan found so far, at most
+            MAX_TIME_BUDGET.
+        calorie_step (float): Calorie resolution of the search (kcal).
+        protein_step (float): Protein resolution of the search (g).
+    Returns:
+        dict: Plan status, chosen items with portions, totals, lower bound and solve time. Status is
+            "optimal" when the plan matches the lower bound, "approximate" when the bucket
+            resolution leaves a gap (a better plan may exist), "no_plan_found" when the bound allows a
+            plan but none was found at this resolution, "infeasible" when no plan can meet the
+            constraints, or "time_limit".
+    """
+    try:
+        start = time.perf_counter()
+        if category_minimums is None:
+            category_minimums = {"Injera": 1}
+        if not 1 <= max_items <= MAX_PLAN_ITEMS:
+            raise ValueError(f"max_items must be between 1 and {MAX_PLAN_ITEMS}.")
+        if not portion_sizes or len(portion_sizes) > MAX_PORTION_SIZES:
+            raise ValueError(f"portion_sizes must hold between 1 and {MAX_PORTION_SIZES} sizes.")
+        if any(portion <= 0 for portion in portion_sizes):
+            raise ValueError("Portion sizes must be positive.")
+        if not 0 < time_budget <= MAX_TIME_BUDGET:
+            raise ValueError(f"time_budget must be greater than 0 and at most {MAX_TIME_BUDGET} seconds.")
+        if not (min_calories >= 0 and min_protein >= 0):
+            raise ValueError("min_calories and min_protein cannot be negative.")
+        if not (calorie_step > 0 and protein_step > 0):
+            raise ValueError("calorie_step and protein_step must be positive.")
+        if any(count < 0 for count in category_minimums.values()):
+            raise ValueError("Category minimums cannot be negative.")
+        if sum(category_minimums.values()) > max_items:
+            raise ValueError("Category minimums require more foods than max_items allows.")
+
+        cache_key = (
+            hash(tuple(food["name"] for food in foods)), max_glycemic_load, min_calories, min_protein,
+            tuple(sorted(category_minimums.items())), tuple(portion_sizes), max_items, calorie_step, protein_step
+        )
+        with _plan_cache_lock:
+            cached = _plan_cache.get(cache_key)
+            if cached is not None:
+                _plan_cache.move_to_end(cache_key)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        # A food outside the first max_items Pareto layers of its constraint group is dominated
+        # by at least max_items others, so some dominator can always replace it in a plan
+        constraint_keys = sorted(key for key, count in category_minimums.items() if count > 0)
+        groups = {}
+        for i, food in enumerate(foods):
+            groups.setdefault(tuple(_matches(food, key) for key in constraint_keys), []).append(i)
+        candidates = []
+        for members in groups.values():
+            points = [
+                (
+                    _midpoint(foods[i]["carb_range"]) * _midpoint(foods[i]["gi_range"]),
+                    _midpoint(foods[i]["calorie_range"]),
+                    _midpoint(foods[i]["protein_range"])
+                )
+                for i in members
+            ]
+            candidates.extend(members[j] for j in _pareto_layers(points, max_items))
+        candidates.sort()
+        logger.info(f"Meal planner kept {len(candidates)} of {len(foods)} foods after dominance pruning")
+
+        solve_args = (
+            [foods[i] for i in candidates], constraint_keys, category_minimums, min_calories, min_protein,
+            portion_sizes, max_items, calorie_step, protein_step, start + time_budget
+        )
+        choices, plan_gl, completed = _solve(*solve_args)
+        _, lower_bound, bound_completed = _solve(*solve_args, round_up=True)
+        completed = completed and bound_completed
+
+        items = []
+        for i, portion in choices or []:
+            food = foods[candidates[i]]
+            scale = portion / 100
+            items.append({
+                "food_name": food["name"],
+                "category": food["category"],
+                "portion_g": portion,
+                "glycemic_load": round(_midpoint(food["carb_range"]) * _midpoint(food["gi_range"]) / 100 * scale, 2),
+                "calories_kcal": round(_midpoint(food["calorie_range"]) * scale, 1),
+                "protein_g": round(_midpoint(food["protein_range"]) * scale, 1)
+            })
+        totals = {
+            "glycemic_load": round(plan_gl, 2) if choices else 0.0,
+            "calories_kcal": round(sum(item["calories_kcal"] for item in items), 1),
+            "protein_g": round(sum(item["protein_g"] for item in items), 1)
+        }
+
+        # An empty plan is a valid plan when the minimums are already met
+        found = choices is not None and plan_gl <= max_glycemic_load + 1e-9
+        if not completed:
+            status = "time_limit"
+        elif lower_bound is None or lower_bound > max_glycemic_load + 1e-9:
+            status = "infeasible"
+        elif not found:
+            status = "no_plan_found"
+        elif plan_gl <= lower_bound + 1e-6:
+            status = "optimal"
+        else:
+            status = "approximate"
+        if not found:
+            items = []
+
+        result = {
+            "status": status,
+            "items": items,
+            "totals": totals if found else {},
+            "lower_bound_glycemic_load": round(lower_bound, 2) if lower_bound is not None else None,
+            "solve_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+        logger.info(f"Meal plan {status} in {result['solve_ms']} ms: {[item['food_name'] for item in items]}")
+
+        # Only complete searches are cached; a timed-out search may improve with a larger budget
+        if completed:
+            with _plan_cache_lock:
+                _plan_cache[cache_key] = result
+                _plan_cache.move_to_end(cache_key)
+                if len(_plan_cache) > PLAN_CACHE_SIZE:
+                    _plan_cache.popitem(last=False)
+        return {**result, "cached": False}
+
+    except Exception as e:
+        logger.error(f"Error planning meals: {e}")
+        raise
+
+if __name__ == "__main__":
+    for size in [len(ALL_FOODS), 10000, 100000]:
+        foods = ALL_FOODS if size == len(ALL_FOODS) else generate_synthetic_catalog(size)
+        plan = plan_meals(foods, time_budget=MAX_TIME_BUDGET)
+        logger.info(f"Benchmark: {size} foods, status {plan['status']} (lower bound {plan['lower_bound_glycemic_load']}), {plan['solve_ms']} ms, totals {plan['totals']}")
+        start = time.perf_counter()
+        cached = plan_meals(foods, time_budget=MAX_TIME_BUDGET)["cached"]
+        logger.info(f"Benchmark: {size} foods, repeat lookup cached={cached} in {(time.perf_counter() - start) * 1000:.2f} ms")
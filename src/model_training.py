@@ -59,13 +59,14 @@ def train_model(df):
         logger.error(f"Error training model: {e}")
         raise
 
-def predict_glucose(food_name, model, vectorizer):
+def predict_glucose(food_name, model, vectorizer, corrections=None):
     """
     Predict glucose content for a given food name.
     Args:
         food_name (str): Name of the food.
         model: Trained model.
         vectorizer: Fitted TF-IDF vectorizer.
+        corrections (dict): Optional per-food corrections learned from feedback (g/100g).
     Returns:
         float: Predicted glucose content (g/100g).
     """
@@ -87,7 +88,11 @@ def predict_glucose(food_name, model, vectorizer):
         if len(prediction) == 0:
             raise ValueError(f"Model prediction returned an empty array for '{food_name}'.")
         
-        return round(float(prediction[0]), 2)
+        glucose_content = float(prediction[0])
+        if corrections and food_name.strip().lower() in corrections:
+            glucose_content = max(glucose_content + corrections[food_name.strip().lower()], 0.0)
+        
+        return round(glucose_content, 2)
     
     except Exception as e:
         logger.error(f"Error predicting for '{food_name}': {e}")
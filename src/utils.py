@@ -10,6 +10,10 @@ def setup_logging():
     logger = logging.getLogger("FoodGlucoseApp")
     logger.setLevel(logging.INFO)
     
+    # Every module calls this at import; only attach handlers once
+    if logger.handlers:
+        return logger
+    
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)
     